@@ -7,9 +7,10 @@ from setuptools import find_packages, setup
 
 MAIN_REQUIREMENTS = [
     "airbyte-cdk==0.1.49",
-    "cached_property==1.5.2",
     "facebook_business==12.0.1",
+    "orjson~=3.6",
     "pendulum>=2,<3",
+    "pybase64~=1.2",
 ]
 
 TEST_REQUIREMENTS = [
@@ -9,13 +9,12 @@ from time import sleep
 
 import backoff
 import pendulum
-from cached_property import cached_property
 from facebook_business import FacebookAdsApi
 from facebook_business.adobjects import user as fb_user
 from facebook_business.adobjects.adaccount import AdAccount
 from facebook_business.api import FacebookResponse
 from facebook_business.exceptions import FacebookRequestError
-from source_facebook_marketing.streams.common import retry_pattern
+from source_facebook_marketing.streams.common import cached_property, retry_pattern
 
 logger = logging.getLogger("airbyte")
 
@@ -10,11 +10,11 @@ import pendulum
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.core import package_name_from_class
 from airbyte_cdk.sources.utils.schema_helpers import ResourceSchemaLoader
-from cached_property import cached_property
 from source_facebook_marketing.streams.async_job import AsyncJob, InsightAsyncJob
 from source_facebook_marketing.streams.async_job_manager import InsightAsyncJobManager
 
 from .base_streams import FBMarketingIncrementalStream
+from .common import cached_property
 
 logger = logging.getLogger("airbyte")
 
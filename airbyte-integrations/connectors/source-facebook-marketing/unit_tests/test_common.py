@@ -0,0 +1,23 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+import pendulum
+import pytest
+from source_facebook_marketing.streams.common import parse_fb_datetime
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2021-07-01T12:34:56+0000",
+        "2021-07-01T12:34:56+00:00",
+        "2021-07-01T12:34:56-0700",
+        "2021-07-01T12:34:56Z",
+        "2021-07-01 12:34:56",
+    ],
+)
+def test_parse_fb_datetime(value):
+    parsed = parse_fb_datetime(value)
+    assert parsed == pendulum.parse(value)
+    assert parsed.tzinfo is not None
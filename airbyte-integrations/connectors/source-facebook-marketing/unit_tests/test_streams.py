@@ -16,7 +16,7 @@ def test_filter_all_statuses(api, mocker):
             {
                 "field": "None.delivery_info",
                 "operator": "IN",
-                "value": [
+                "value": (
                     "active",
                     "archived",
                     "completed",
@@ -31,7 +31,7 @@ def test_filter_all_statuses(api, mocker):
                     "rejected",
                     "scheduled",
                     "inactive",
-                ],
+                ),
             }
         ]
     }
@@ -46,6 +46,23 @@ def test_fetch_thumbnail_data_url(url, requests_mock):
     assert fetch_thumbnail_data_url(url) == "data:content-type;base64,"
 
 
+def test_fetch_thumbnail_data_url_cache(requests_mock):
+    url = "https://graph.facebook.com?cached=1"
+    matcher = requests_mock.get(url, status_code=200, headers={"content-type": "content-type"}, content=b"")
+
+    assert fetch_thumbnail_data_url(url) == fetch_thumbnail_data_url(url)
+    assert matcher.call_count == 1
+
+
+def test_fetch_thumbnail_data_url_no_cache_on_failure(requests_mock):
+    url = "https://graph.facebook.com?failed=1"
+    matcher = requests_mock.get(url, status_code=404)
+
+    assert fetch_thumbnail_data_url(url) is None
+    assert fetch_thumbnail_data_url(url) is None
+    assert matcher.call_count == 2
+
+
 def test_parse_call_rate_header():
     headers = {
         "x-business-use-case-usage": '{"test":[{"type":"ads_management","call_count":1,"total_cputime":1,'